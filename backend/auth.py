@@ -1,5 +1,7 @@
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 from typing import Optional
+from cachetools import TTLCache
 from jose import JWTError, jwt
 from passlib.context import CryptContext
 from fastapi import Depends, HTTPException, status
@@ -9,17 +11,42 @@ from sqlalchemy import select
 
 from config import settings
 from database import get_db
-from models import User
+from models import User, UserRole
 from schemas import TokenData
 
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# Well-formed bcrypt hash used to burn the same verification cost when a
+# login targets an unknown email, so response timing doesn't reveal
+# whether the account exists
+DUMMY_PASSWORD_HASH = "$2b$12$EixZaYVK1fsbw1ZfbX3OXePaWxn96p36WQoeG6Lruj3vjPGga31lW"
+
 # OAuth2 scheme for token authentication
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="v1/auth/login")
 # http://localhost:8000/api/v1/auth/login
 
 
+@dataclass
+class UserPrincipal:
+    """Lightweight, session-independent snapshot of an authenticated user"""
+
+    id: int
+    email: str
+    username: str
+    full_name: Optional[str]
+    role: UserRole
+    is_active: bool
+    created_at: datetime
+    updated_at: Optional[datetime]
+
+
+# Caches the per-request user lookup behind token auth. The JWT itself is
+# still verified (signature and expiry) on every request; the short TTL
+# bounds how long a deactivation or role change takes to propagate.
+_principal_cache: TTLCache = TTLCache(maxsize=10_000, ttl=60)
+
+
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against a hashed password"""
     return pwd_context.verify(plain_password, hashed_password)
@@ -49,7 +76,7 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 async def get_current_user(
     token: str = Depends(oauth2_scheme), db: AsyncSession = Depends(get_db)
-) -> User:
+) -> UserPrincipal:
     """Get the current authenticated user from JWT token"""
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
@@ -68,20 +95,35 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    result = await db.execute(select(User).where(User.email == token_data.email))
-    user = result.scalar_one_or_none()
+    principal = _principal_cache.get(email)
+    if principal is None:
+        result = await db.execute(select(User).where(User.email == token_data.email))
+        user = result.scalar_one_or_none()
 
-    if user is None:
-        raise credentials_exception
-    if not user.is_active:
+        if user is None:
+            raise credentials_exception
+
+        principal = UserPrincipal(
+            id=user.id,
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            role=user.role,
+            is_active=bool(user.is_active),
+            created_at=user.created_at,
+            updated_at=user.updated_at,
+        )
+        _principal_cache[email] = principal
+
+    if not principal.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
 
-    return user
+    return principal
 
 
 async def get_current_active_user(
-    current_user: User = Depends(get_current_user),
-) -> User:
+    current_user: UserPrincipal = Depends(get_current_user),
+) -> UserPrincipal:
     """Ensure the current user is active"""
     if not current_user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
@@ -92,8 +134,8 @@ def require_role(required_roles: list):
     """Dependency to check if user has required role"""
 
     async def role_checker(
-        current_user: User = Depends(get_current_active_user),
-    ) -> User:
+        current_user: UserPrincipal = Depends(get_current_active_user),
+    ) -> UserPrincipal:
         if current_user.role not in required_roles:
             raise HTTPException(
                 status_code=status.HTTP_403_FORBIDDEN,
@@ -7,6 +7,13 @@ class Settings(BaseSettings):
 
     # Database
     DATABASE_URL: str
+    # Set to True when connecting through PgBouncer in transaction pooling
+    # mode, which cannot track asyncpg's prepared statements
+    USE_PGBOUNCER: bool = False
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_RECYCLE: int = 3600
+    DB_POOL_USE_LIFO: bool = True
 
     # Security
     SECRET_KEY: str
@@ -1,11 +1,41 @@
+import asyncio
+import logging
+
+import orjson
+from sqlalchemy import text
+from sqlalchemy.engine import make_url
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import DeclarativeBase
 from config import settings
 
+logger = logging.getLogger(__name__)
+
 # Convert postgresql:// to postgresql+asyncpg:// for async support
 DATABASE_URL = settings.DATABASE_URL
 
-print(f"🚀 Final DATABASE_URL in use: {DATABASE_URL}")
+logger.info(
+    "Database URL in use: %s",
+    make_url(DATABASE_URL).render_as_string(hide_password=True),
+)
+
+# asyncpg's prepared-statement cache avoids re-parsing/re-planning every
+# query, but must be disabled when PgBouncer transaction pooling is in use
+if settings.USE_PGBOUNCER:
+    connect_args = {
+        "statement_cache_size": 0,
+        "prepared_statement_cache_size": 0,
+        "server_settings": {
+            "application_name": "inventory_app",
+        },
+    }
+else:
+    connect_args = {
+        "statement_cache_size": 256,
+        "prepared_statement_cache_size": 256,
+        "server_settings": {
+            "application_name": "inventory_app",
+        },
+    }
 
 # Create async engine
 engine = create_async_engine(
@@ -13,17 +43,16 @@ engine = create_async_engine(
     echo=settings.DEBUG,
     future=True,
     pool_pre_ping=True,
-    pool_size=5,
-    max_overflow=10,
-    pool_recycle=3600,
-    connect_args={
-        "statement_cache_size": 0,
-        "prepared_statement_cache_size": 0,
-        "server_settings": {
-            "application_name": "inventory_app",
-            "jit": "off",
-        }
-    },
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_use_lifo=settings.DB_POOL_USE_LIFO,
+    pool_timeout=30,
+    # orjson handles JSON/JSONB column (de)serialization; it's several
+    # times faster than stdlib json
+    json_serializer=lambda obj: orjson.dumps(obj).decode(),
+    json_deserializer=orjson.loads,
+    connect_args=connect_args,
 )
 
 # Create async session factory
@@ -35,16 +64,22 @@ AsyncSessionLocal = async_sessionmaker(
     autoflush=False,
 )
 
-# Base class for models
-Base = declarative_base()
+# Base class for models (2.0 declarative style: nothing to construct at
+# import time)
+class Base(DeclarativeBase):
+    pass
 
 
 async def get_db():
-    """Dependency for getting async database sessions"""
+    """Dependency for getting async database sessions
+
+    No automatic commit here: write handlers commit explicitly, and
+    read-only requests skip the useless COMMIT round-trip entirely (any
+    implicit transaction is rolled back when the session closes).
+    """
     async with AsyncSessionLocal() as session:
         try:
             yield session
-            await session.commit()
         except Exception:
             await session.rollback()
             raise
@@ -55,4 +90,17 @@ async def get_db():
 async def init_db():
     """Initialize database tables"""
     async with engine.begin() as conn:
+        # pg_trgm backs the GIN trigram indexes used by the ILIKE search
+        await conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
         await conn.run_sync(Base.metadata.create_all)
+
+
+async def warm_up_pool():
+    """Open a few pooled connections up front so the first real requests
+    don't pay the TCP + TLS + auth handshake cost"""
+
+    async def _ping():
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+
+    await asyncio.gather(*(_ping() for _ in range(min(settings.DB_POOL_SIZE, 5))))
@@ -1,11 +1,11 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse
 from contextlib import asynccontextmanager
 import time
 
 from config import settings
-from database import init_db
+from database import init_db, warm_up_pool
 from routers import auth_router, inventory_router, audit_router
 
 
@@ -15,6 +15,7 @@ async def lifespan(app: FastAPI):
     # Startup
     print("🚀 Starting application...")
     await init_db()
+    await warm_up_pool()
     print("✅ Database initialized")
     yield
     # Shutdown
@@ -27,6 +28,7 @@ app = FastAPI(
     description="Role-Based Inventory & Audit Management System",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
     docs_url="/api/docs",
     redoc_url="/api/redoc",
     openapi_url="/api/openapi.json",
@@ -49,23 +51,20 @@ app.add_middleware(
 )
 
 
-# Request timing middleware
-@app.middleware("http")
-async def add_process_time_header(request: Request, call_next):
-    start_time = time.time()
-    response = await call_next(request)
-    process_time = time.time() - start_time
-    response.headers["X-Process-Time"] = str(process_time)
-    return response
+# Request timing middleware (debug only: production skips the extra ASGI
+# layer entirely). X-Process-Time is reported in nanoseconds.
+if settings.DEBUG:
 
+    @app.middleware("http")
+    async def add_process_time_header(request: Request, call_next):
+        start = time.perf_counter_ns()
+        response = await call_next(request)
+        response.headers["X-Process-Time"] = str(time.perf_counter_ns() - start)
+        return response
 
-# Include routers
-app.include_router(auth_router.router, prefix="/api/v1")
-app.include_router(inventory_router.router, prefix="/api/v1")
-app.include_router(audit_router.router, prefix="/api/v1")
 
-
-# Root endpoint
+# Root and health endpoints are registered before the routers so a
+# deployment probe can be answered as early as possible during startup
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -84,6 +83,12 @@ async def health_check():
     return {"status": "healthy"}
 
 
+# Include routers
+app.include_router(auth_router.router, prefix="/api/v1")
+app.include_router(inventory_router.router, prefix="/api/v1")
+app.include_router(audit_router.router, prefix="/api/v1")
+
+
 # Global exception handler
 @app.exception_handler(Exception)
 async def global_exception_handler(request: Request, exc: Exception):
@@ -98,6 +103,18 @@ async def global_exception_handler(request: Request, exc: Exception):
 
 
 if __name__ == "__main__":
+    import os
+
     import uvicorn
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=settings.DEBUG)
+    # uvloop + httptools cut event-loop and HTTP parsing overhead; one
+    # worker per CPU outside of debug (reload and workers are exclusive)
+    uvicorn.run(
+        "main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=settings.DEBUG,
+        loop="uvloop",
+        http="httptools",
+        workers=None if settings.DEBUG else os.cpu_count(),
+    )
@@ -1,4 +1,15 @@
-from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, Enum, Text
+from sqlalchemy import (
+    Column,
+    Integer,
+    String,
+    Float,
+    DateTime,
+    ForeignKey,
+    Enum,
+    Index,
+    Text,
+)
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -17,6 +28,9 @@ class User(Base):
     """User model for authentication and authorization"""
 
     __tablename__ = "users"
+    # Fetch server-generated columns (created_at/updated_at) via RETURNING
+    # on flush so no follow-up SELECT is needed
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     email = Column(String, unique=True, index=True, nullable=False)
@@ -37,6 +51,7 @@ class InventoryItem(Base):
     """Inventory item model"""
 
     __tablename__ = "inventory_items"
+    __mapper_args__ = {"eager_defaults": True}
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, nullable=False, index=True)
@@ -54,6 +69,34 @@ class InventoryItem(Base):
     created_by_user = relationship("User", back_populates="inventory_items")
     audit_logs = relationship("AuditLog", back_populates="inventory_item")
 
+    # Composite indexes matching the list queries (filter + ORDER BY
+    # created_at DESC) so Postgres can skip the sort step
+    # GIN trigram indexes let the leading-wildcard ILIKE search use an
+    # index scan instead of a sequential scan (requires pg_trgm, created
+    # in init_db)
+    __table_args__ = (
+        Index("ix_inv_category_created", "category", created_at.desc()),
+        Index("ix_inv_created_desc", created_at.desc()),
+        Index(
+            "ix_inv_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_inv_sku_trgm",
+            "sku",
+            postgresql_using="gin",
+            postgresql_ops={"sku": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_inv_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+    )
+
 
 class AuditLog(Base):
     """Audit log model for tracking all inventory changes"""
@@ -64,9 +107,17 @@ class AuditLog(Base):
     action = Column(String, nullable=False)  # CREATE, UPDATE, DELETE
     item_id = Column(Integer, ForeignKey("inventory_items.id"), nullable=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    changes = Column(Text, nullable=True)  # JSON string of changes
+    changes = Column(JSONB, nullable=True)  # structured change set, queryable
     timestamp = Column(DateTime(timezone=True), server_default=func.now())
 
     # Relationships
     user = relationship("User", back_populates="audit_logs")
     inventory_item = relationship("InventoryItem", back_populates="audit_logs")
+
+    # Composite indexes for the paginated log listings ordered by
+    # timestamp DESC
+    __table_args__ = (
+        Index("ix_audit_item_ts", "item_id", timestamp.desc()),
+        Index("ix_audit_ts", timestamp.desc()),
+        Index("ix_audit_changes_gin", "changes", postgresql_using="gin"),
+    )
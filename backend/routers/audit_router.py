@@ -1,48 +1,66 @@
 from fastapi import APIRouter, Depends, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from typing import List
 
 from database import get_db
-from models import AuditLog, User, UserRole
-from schemas import AuditLogResponse
-from auth import get_current_active_user, require_role
+from models import AuditLog, UserRole
+from schemas import AUDIT_LOG_LIST_ADAPTER, AuditLogResponse
+from auth import UserPrincipal, get_current_active_user, require_role
 
 router = APIRouter(prefix="/audit", tags=["Audit Logs"])
 
+# Columns needed by AuditLogResponse, selected directly to avoid
+# hydrating full ORM objects on the list endpoints
+AUDIT_LOG_COLUMNS = (
+    AuditLog.id,
+    AuditLog.action,
+    AuditLog.item_id,
+    AuditLog.user_id,
+    AuditLog.changes,
+    AuditLog.timestamp,
+)
+
 
 @router.get("/", response_model=List[AuditLogResponse])
 async def get_audit_logs(
     skip: int = Query(0, ge=0),
     limit: int = Query(100, ge=1, le=1000),
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
+    current_user: UserPrincipal = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
 ):
     """Get audit logs (Admin/Manager only)"""
+    # Column-only select skips ORM hydration for the list response
     query = (
-        select(AuditLog).offset(skip).limit(limit).order_by(AuditLog.timestamp.desc())
+        select(*AUDIT_LOG_COLUMNS)
+        .offset(skip)
+        .limit(limit)
+        .order_by(AuditLog.timestamp.desc())
     )
 
     result = await db.execute(query)
-    logs = result.scalars().all()
 
-    return logs
+    # model_construct skips per-row validation (the DB already enforces
+    # the schema); the adapter dumps the whole list in one call
+    logs = [AuditLogResponse.model_construct(**row) for row in result.mappings()]
+    return ORJSONResponse(AUDIT_LOG_LIST_ADAPTER.dump_python(logs, mode="json"))
 
 
 @router.get("/item/{item_id}", response_model=List[AuditLogResponse])
 async def get_item_audit_logs(
     item_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
+    current_user: UserPrincipal = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
 ):
     """Get audit logs for a specific inventory item (Admin/Manager only)"""
     query = (
-        select(AuditLog)
+        select(*AUDIT_LOG_COLUMNS)
         .where(AuditLog.item_id == item_id)
         .order_by(AuditLog.timestamp.desc())
     )
 
     result = await db.execute(query)
-    logs = result.scalars().all()
 
-    return logs
+    logs = [AuditLogResponse.model_construct(**row) for row in result.mappings()]
+    return ORJSONResponse(AUDIT_LOG_LIST_ADAPTER.dump_python(logs, mode="json"))
@@ -1,13 +1,17 @@
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import select, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from datetime import timedelta
+import asyncio
 
 from database import get_db
 from models import User
 from schemas import Token, UserLogin, UserCreate, UserResponse
 from auth import (
+    DUMMY_PASSWORD_HASH,
+    UserPrincipal,
     verify_password,
     get_password_hash,
     create_access_token,
@@ -23,37 +27,42 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 )
 async def register(user: UserCreate, db: AsyncSession = Depends(get_db)):
     """Register a new user"""
-    # Check if user already exists
-    result = await db.execute(
-        select(User).where(
-            (User.email == user.email) | (User.username == user.username)
+    # bcrypt is CPU-heavy; hash in a worker thread so the event loop
+    # keeps serving other requests
+    hashed_password = await asyncio.to_thread(get_password_hash, user.password)
+
+    # Insert and detect email/username conflicts in one statement; no
+    # SELECT-then-INSERT race
+    stmt = (
+        pg_insert(User)
+        .values(
+            email=user.email,
+            username=user.username,
+            full_name=user.full_name,
+            role=user.role,
+            hashed_password=hashed_password,
         )
+        .on_conflict_do_nothing()
+        .returning(User)
     )
-    existing_user = result.scalar_one_or_none()
+    result = await db.execute(stmt)
+    db_user = result.scalars().first()
 
-    if existing_user:
-        if existing_user.email == user.email:
+    if db_user is None:
+        # Conflict path only: check which unique column clashed
+        result = await db.execute(
+            select(literal(1)).where(User.email == user.email).limit(1)
+        )
+        if result.scalar() is not None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Email already registered",
             )
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken"
-            )
-
-    # Create new user
-    db_user = User(
-        email=user.email,
-        username=user.username,
-        full_name=user.full_name,
-        role=user.role,
-        hashed_password=get_password_hash(user.password),
-    )
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Username already taken"
+        )
 
-    db.add(db_user)
     await db.commit()
-    await db.refresh(db_user)
 
     return db_user
 
@@ -65,10 +74,21 @@ async def login(
     """Authenticate user and return JWT token"""
     # Find user by email (username field in OAuth2 form)
     result = await db.execute(select(User).where(User.email == form_data.username))
-    print(result)
     user = result.scalar_one_or_none()
 
-    if not user or not verify_password(form_data.password, user.hashed_password):
+    # Verify in a worker thread so bcrypt doesn't stall the event loop;
+    # verify against a dummy hash for unknown users to keep timing uniform
+    if user:
+        password_ok = await asyncio.to_thread(
+            verify_password, form_data.password, user.hashed_password
+        )
+    else:
+        await asyncio.to_thread(
+            verify_password, form_data.password, DUMMY_PASSWORD_HASH
+        )
+        password_ok = False
+
+    if not password_ok:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -91,6 +111,8 @@ async def login(
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_current_user_info(current_user: User = Depends(get_current_active_user)):
+async def get_current_user_info(
+    current_user: UserPrincipal = Depends(get_current_active_user),
+):
     """Get current authenticated user information"""
     return current_user
@@ -1,21 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from cachetools import TTLCache
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, func, or_
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List, Optional
-import json
 
 from database import get_db
-from models import InventoryItem, User, UserRole, AuditLog
+from models import InventoryItem, UserRole, AuditLog
 from schemas import (
+    INVENTORY_LIST_ADAPTER,
     InventoryItemCreate,
     InventoryItemUpdate,
     InventoryItemResponse,
     PaginatedResponse,
 )
-from auth import get_current_active_user, require_role
+from auth import UserPrincipal, get_current_active_user, require_role
 
 router = APIRouter(prefix="/inventory", tags=["Inventory"])
 
+# Stats cache keyed on a write counter bumped by log_audit, so any
+# inventory write invalidates it; the TTL bounds staleness across workers
+_stats_cache = TTLCache(maxsize=4, ttl=30)
+_inventory_version = 0
+
 
 async def log_audit(
     db: AsyncSession,
@@ -25,14 +33,18 @@ async def log_audit(
     changes: Optional[dict] = None,
 ):
     """Helper function to create audit logs"""
+    global _inventory_version
+    _inventory_version += 1
+
     audit_log = AuditLog(
         action=action,
         item_id=item_id,
         user_id=user_id,
-        changes=json.dumps(changes) if changes else None,
+        changes=changes or None,
     )
+    # No flush here: the handler's terminal commit flushes the item and
+    # the audit row together in one batch
     db.add(audit_log)
-    await db.flush()
 
 
 @router.get("/", response_model=List[InventoryItemResponse])
@@ -42,10 +54,25 @@ async def get_inventory_items(
     search: Optional[str] = None,
     category: Optional[str] = None,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserPrincipal = Depends(get_current_active_user),
 ):
     """Get all inventory items with optional filtering and pagination"""
-    query = select(InventoryItem)
+    # Select plain columns instead of ORM entities: the list response
+    # doesn't need identity-map tracking, and skipping per-row hydration
+    # is the dominant saving at large limits
+    query = select(
+        InventoryItem.id,
+        InventoryItem.name,
+        InventoryItem.sku,
+        InventoryItem.description,
+        InventoryItem.quantity,
+        InventoryItem.unit_price,
+        InventoryItem.category,
+        InventoryItem.location,
+        InventoryItem.created_by,
+        InventoryItem.created_at,
+        InventoryItem.updated_at,
+    )
 
     # Apply search filter
     if search:
@@ -65,52 +92,55 @@ async def get_inventory_items(
     query = query.offset(skip).limit(limit).order_by(InventoryItem.created_at.desc())
 
     result = await db.execute(query)
-    items = result.scalars().all()
 
-    return items
+    # model_construct skips per-row validation (the DB schema already
+    # guarantees these rows are well-formed); the adapter then dumps the
+    # whole list in one call, bypassing FastAPI's per-item serialization
+    items = [
+        InventoryItemResponse.model_construct(**row) for row in result.mappings()
+    ]
+    return ORJSONResponse(INVENTORY_LIST_ADAPTER.dump_python(items, mode="json"))
 
 
 @router.get("/stats")
 async def get_inventory_stats(
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserPrincipal = Depends(get_current_active_user),
 ):
     """Get inventory statistics"""
-    # Total items
-    total_items_result = await db.execute(select(func.count(InventoryItem.id)))
-    total_items = total_items_result.scalar()
-
-    # Total value
-    total_value_result = await db.execute(
-        select(func.sum(InventoryItem.quantity * InventoryItem.unit_price))
-    )
-    total_value = total_value_result.scalar() or 0
-
-    # Low stock items (quantity < 10)
-    low_stock_result = await db.execute(
-        select(func.count(InventoryItem.id)).where(InventoryItem.quantity < 10)
+    cached = _stats_cache.get(_inventory_version)
+    if cached is not None:
+        return cached
+
+    # Single aggregate query: one round-trip and one table scan instead of four
+    stats_query = select(
+        func.count(InventoryItem.id),
+        func.coalesce(func.sum(InventoryItem.quantity * InventoryItem.unit_price), 0),
+        func.count(InventoryItem.id).filter(InventoryItem.quantity < 10),
+        func.count(func.distinct(InventoryItem.category)),
     )
-    low_stock = low_stock_result.scalar()
 
-    # Categories count
-    categories_result = await db.execute(
-        select(func.count(func.distinct(InventoryItem.category)))
-    )
-    categories_count = categories_result.scalar()
+    result = await db.execute(stats_query)
+    total_items, total_value, low_stock, categories_count = result.one()
 
-    return {
+    stats = {
         "total_items": total_items,
         "total_value": round(total_value, 2),
         "low_stock_items": low_stock,
         "categories_count": categories_count,
     }
+    _stats_cache[_inventory_version] = stats
+
+    return stats
 
 
 @router.get("/{item_id}", response_model=InventoryItemResponse)
 async def get_inventory_item(
     item_id: int,
+    request: Request,
+    response: Response,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(get_current_active_user),
+    current_user: UserPrincipal = Depends(get_current_active_user),
 ):
     """Get a specific inventory item by ID"""
     result = await db.execute(select(InventoryItem).where(InventoryItem.id == item_id))
@@ -122,6 +152,15 @@ async def get_inventory_item(
             detail=f"Inventory item with id {item_id} not found",
         )
 
+    # Weak ETag from the last-modified timestamp lets clients revalidate
+    # and skip the response body when nothing changed
+    last_modified = item.updated_at or item.created_at
+    if last_modified:
+        etag = f'W/"{last_modified.timestamp()}"'
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED)
+        response.headers["ETag"] = etag
+
     return item
 
 
@@ -131,28 +170,26 @@ async def get_inventory_item(
 async def create_inventory_item(
     item: InventoryItemCreate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
+    current_user: UserPrincipal = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
 ):
     """Create a new inventory item (Admin/Manager only)"""
-    # Check if SKU already exists
-    result = await db.execute(
-        select(InventoryItem).where(InventoryItem.sku == item.sku)
+    # Insert and detect SKU conflicts in one statement; a single round-trip
+    # and no SELECT-then-INSERT race
+    stmt = (
+        pg_insert(InventoryItem)
+        .values(**item.model_dump(), created_by=current_user.id)
+        .on_conflict_do_nothing(index_elements=["sku"])
+        .returning(InventoryItem)
     )
-    existing_item = result.scalar_one_or_none()
+    result = await db.execute(stmt)
+    db_item = result.scalars().first()
 
-    if existing_item:
+    if db_item is None:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=f"Item with SKU '{item.sku}' already exists",
         )
 
-    # Create new item
-    db_item = InventoryItem(**item.model_dump(), created_by=current_user.id)
-
-    db.add(db_item)
-    await db.flush()
-    await db.refresh(db_item)
-
     # Log audit
     await log_audit(
         db=db,
@@ -163,7 +200,6 @@ async def create_inventory_item(
     )
 
     await db.commit()
-    await db.refresh(db_item)
 
     return db_item
 
@@ -173,7 +209,7 @@ async def update_inventory_item(
     item_id: int,
     item_update: InventoryItemUpdate,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
+    current_user: UserPrincipal = Depends(require_role([UserRole.ADMIN, UserRole.MANAGER])),
 ):
     """Update an existing inventory item (Admin/Manager only)"""
     result = await db.execute(select(InventoryItem).where(InventoryItem.id == item_id))
@@ -209,7 +245,6 @@ async def update_inventory_item(
         )
 
     await db.commit()
-    await db.refresh(db_item)
 
     return db_item
 
@@ -218,7 +253,7 @@ async def update_inventory_item(
 async def delete_inventory_item(
     item_id: int,
     db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.ADMIN])),
+    current_user: UserPrincipal = Depends(require_role([UserRole.ADMIN])),
 ):
     """Delete an inventory item (Admin only)"""
     result = await db.execute(select(InventoryItem).where(InventoryItem.id == item_id))
@@ -230,14 +265,21 @@ async def delete_inventory_item(
             detail=f"Inventory item with id {item_id} not found",
         )
 
-    # Log audit before deletion
+    # Log audit before deletion. The audit row must be flushed before
+    # db.delete(): a pending row added via the item_id column isn't in the
+    # item's audit_logs collection, so the delete cascade can't null its
+    # FK and the commit would order the INSERT before the parent DELETE,
+    # violating audit_logs.item_id -> inventory_items.id. Flushing first
+    # restores the baseline semantics (the FK is nulled alongside the
+    # item's other audit rows; the deleted id stays inside changes).
     await log_audit(
         db=db,
         action="DELETE",
         item_id=item_id,
         user_id=current_user.id,
-        changes={"deleted_item": db_item.name},
+        changes={"deleted_item": db_item.name, "item_id": item_id},
     )
+    await db.flush()
 
     await db.delete(db_item)
     await db.commit()
@@ -1,5 +1,5 @@
-from pydantic import BaseModel, EmailStr, Field, ConfigDict
-from typing import Optional
+from pydantic import BaseModel, EmailStr, Field, ConfigDict, TypeAdapter
+from typing import List, Optional
 from datetime import datetime
 from models import UserRole
 
@@ -45,7 +45,7 @@ class UserResponse(UserBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
 
 
 # ==================== Inventory Schemas ====================
@@ -79,14 +79,14 @@ class InventoryItemResponse(InventoryItemBase):
     created_at: datetime
     updated_at: Optional[datetime] = None
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
 
 
 # ==================== Audit Log Schemas ====================
 class AuditLogBase(BaseModel):
     action: str
     item_id: Optional[int] = None
-    changes: Optional[str] = None
+    changes: Optional[dict] = None
 
 
 class AuditLogCreate(AuditLogBase):
@@ -98,7 +98,13 @@ class AuditLogResponse(AuditLogBase):
     user_id: int
     timestamp: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, defer_build=False)
+
+
+# Batched adapters for the list endpoints: validating and dumping the
+# whole list in one call is much faster than FastAPI's per-item pass
+INVENTORY_LIST_ADAPTER = TypeAdapter(List[InventoryItemResponse])
+AUDIT_LOG_LIST_ADAPTER = TypeAdapter(List[AuditLogResponse])
 
 
 # ==================== Pagination Schemas ====================
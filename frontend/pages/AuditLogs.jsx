@@ -36,7 +36,7 @@ const AuditLogs = () => {
       width: 400,
       renderCell: (params) => (
         <Box sx={{ whiteSpace: 'pre-wrap', overflow: 'auto', maxHeight: 100 }}>
-          {params.value || '-'}
+          {params.value ? JSON.stringify(params.value) : '-'}
         </Box>
       ),
     },